@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+===============================================================
+ Script: buildcache.py
+ Author: Kris Yotam (aka. khr1st)
+ Date:   2026-10-19
+ License: MIT License
+ Description:
+   Content-addressed cache for compiled course notes.
+   The key is a hash of every build input of a course
+   (lectures, master.tex, figures, ../preamble.tex, latexmkrc);
+   an entry holds the resulting PDF plus aux/bbl/toc files.
+   Lectures.compile_master restores an entry instead of running
+   latexmk on a hit. Entries are evicted least recently used
+   first once the cache exceeds BUILD_CACHE_LIMIT.
+
+ Inspiration:
+   Adapted and extended from Gilles Castel's lecture note workflow.
+===============================================================
+"""
+
+import os
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+
+from config import BUILD_CACHE_DIR, BUILD_CACHE_LIMIT
+
+# Files in out/ worth keeping (everything latexmk needs to skip reruns)
+ARTIFACT_SUFFIXES = {".pdf", ".aux", ".bbl", ".blg", ".toc", ".out", ".fls", ".fdb_latexmk", ".gz"}
+
+LATEXMKRC = Path("~/.config/latexmk/latexmkrc").expanduser()
+
+
+# -----------------------------
+# Keys
+# -----------------------------
+
+def build_inputs(root: Path):
+    """
+    All files that influence the build of the course in root,
+    as (label, path) pairs in a stable order.
+    """
+    inputs = [
+        (str(p.relative_to(root)), p)
+        for p in root.rglob("*")
+        if p.is_file()
+        and not any(part.startswith(".") or part == "out" for part in p.relative_to(root).parts)
+    ]
+    for label, path in (("../preamble.tex", root.parent / "preamble.tex"), ("latexmkrc", LATEXMKRC)):
+        if path.exists():
+            inputs.append((label, path))
+    return sorted(inputs)
+
+
+def input_key(root: Path) -> str:
+    """
+    Hash of all build inputs (names and contents).
+    """
+    digest = hashlib.sha256()
+    for label, path in build_inputs(root):
+        digest.update(label.encode() + b"\0")
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+# -----------------------------
+# Store / restore
+# -----------------------------
+
+def restore(key: str, out_dir: Path) -> bool:
+    """
+    Copy the cached artifacts for key into out_dir.
+    Returns False on a cache miss.
+    """
+    entry = BUILD_CACHE_DIR / key
+    if not entry.is_dir():
+        return False
+
+    out_dir.mkdir(exist_ok=True)
+    for artifact in entry.iterdir():
+        fd, tmp = tempfile.mkstemp(dir=out_dir, prefix=f".{artifact.name}.")
+        os.close(fd)
+        shutil.copyfile(artifact, tmp)
+        os.replace(tmp, out_dir / artifact.name)
+
+    # Mark as recently used for LRU eviction
+    os.utime(entry)
+    return True
+
+
+def store(key: str, out_dir: Path):
+    """
+    Save the artifacts in out_dir under key, then enforce the size limit.
+    """
+    entry = BUILD_CACHE_DIR / key
+    if entry.is_dir():
+        os.utime(entry)
+        return
+
+    BUILD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=BUILD_CACHE_DIR, prefix=".tmp-"))
+    for artifact in out_dir.iterdir():
+        if artifact.is_file() and artifact.suffix in ARTIFACT_SUFFIXES:
+            shutil.copyfile(artifact, tmp / artifact.name)
+
+    try:
+        tmp.rename(entry)
+    except OSError:
+        # Another compile stored the same key first
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    evict()
+
+
+def evict(limit: int = BUILD_CACHE_LIMIT):
+    """
+    Remove least recently used entries until the cache fits in limit.
+    """
+    entries = []
+    for entry in BUILD_CACHE_DIR.iterdir():
+        if entry.is_dir() and not entry.name.startswith("."):
+            size = sum(f.stat().st_size for f in entry.iterdir())
+            entries.append((entry.stat().st_mtime, size, entry))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries):
+        if total <= limit:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+===============================================================
+ Script: bulk-lectures.py
+ Author: Kris Yotam (aka. khr1st)
+ Date:   2026-10-19
+ License: MIT License
+ Description:
+   Pre-generates lecture stubs for a whole semester.
+   Takes a schedule of dates from an .ics export, a JSON file
+   or the Google Calendar used by countdown.py, and creates
+   every lec_XX.tex with its \lecture{n}{date}{} header.
+   master.tex is rewritten only once for the whole batch.
+
+   Usage:
+     bulk-lectures.py --ics schedule.ics [--from ...] [--to ...] [--course SHORT]
+     bulk-lectures.py --json schedule.json [--from ...] [--to ...]
+     bulk-lectures.py --calendar --from 2026-02-09 --to 2026-05-22
+
+   JSON may be a list of ISO datetimes or of objects with a
+   "start" (and optionally "summary") key. Every source is limited
+   to --from (default today) .. --to (default 16 weeks later), and
+   recurring .ics events are expanded in that window. Dates on a day
+   that already has a lecture, or before the latest lecture, are
+   skipped so numbering stays chronological.
+
+ Inspiration:
+   Adapted and extended from Gilles Castel's lecture note workflow.
+===============================================================
+"""
+
+import os
+import sys
+import json
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import ics
+from courses import Courses
+from config import USERCALENDARID
+
+
+# -----------------------------
+# Schedule sources
+# -----------------------------
+
+def events_from_json(path: Path):
+    """
+    Read events from a JSON schedule (strings or objects).
+    """
+    events = []
+    for item in json.loads(Path(path).read_text()):
+        if isinstance(item, str):
+            item = {"start": item}
+        events.append({
+            "summary": item.get("summary"),
+            "start": datetime.fromisoformat(item["start"]),
+        })
+    return events
+
+
+def events_from_calendar(start: datetime, end: datetime):
+    """
+    Fetch events through the same Google Calendar service as countdown.py.
+    """
+    import countdown
+
+    os.chdir(sys.path[0])
+    service = countdown.authenticate()
+    return countdown.get_events(service, USERCALENDARID, start.astimezone(), end.astimezone())
+
+
+def to_local(date: datetime) -> datetime:
+    """Aware datetimes to local naive time; naive ones are kept."""
+    return date.astimezone().replace(tzinfo=None) if date.tzinfo else date
+
+
+def lecture_dates(events, course, start: datetime, end: datetime):
+    """
+    Keep events belonging to this course (summary contains its title,
+    same rule as countdown.activate_course) that start within
+    [start, end], and return local naive dates.
+    Events without a summary are always kept.
+    """
+    title = course.info["title"].lower()
+    start, end = to_local(start), to_local(end)
+    dates = []
+    for event in events:
+        if event.get("summary") and title not in event["summary"].lower():
+            continue
+        date = to_local(event["start"])
+        if start <= date <= end:
+            dates.append(date)
+    return dates
+
+
+# -----------------------------
+# Main
+# -----------------------------
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Create lecture stubs from a schedule.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--ics", type=Path, help=".ics calendar export")
+    source.add_argument("--json", type=Path, help="JSON list of dates")
+    source.add_argument("--calendar", action="store_true", help="Google Calendar (countdown.py)")
+    parser.add_argument("--from", dest="start", type=datetime.fromisoformat, default=datetime.today())
+    parser.add_argument("--to", dest="end", type=datetime.fromisoformat)
+    parser.add_argument("--course", help="course short name (default: current course)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    courses = Courses()
+
+    if args.course:
+        course = next((c for c in courses if c.info["short"] == args.course), None)
+        if course is None:
+            sys.exit(f"[error] Unknown course: {args.course}")
+    else:
+        course = courses.current
+
+    end = args.end or args.start + timedelta(weeks=16)
+    if args.ics:
+        events = ics.IcsCalendar(args.ics).events(args.start.astimezone(), end.astimezone())
+    elif args.json:
+        events = events_from_json(args.json)
+    else:
+        events = events_from_calendar(args.start, end)
+
+    created = course.lectures.new_lectures(lecture_dates(events, course, args.start, end))
+    print(f"[ok] Created {len(created)} lectures for {course.info['title']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,22 +9,30 @@
    Updates each course's master.tex to include all lectures
    and compiles the resulting document. Ensures all notes
    are kept in sync and compiled for quick access (e.g. phone).
+   Changed PDFs are then exported to PDF_EXPORT_DIR.
+
+   Usage:
+     compile-all-masters.py [RANGE]   # default: all
+
+   RANGE is any lecture range expression (e.g. "last:3", "w3-w5").
 
  Inspiration:
    Adapted and extended from Gilles Castel's lecture note workflow.
 ===============================================================
 """
 
+import sys
+
 from courses import Courses
+from export import export_pdfs
 
 
-def compile_course(course):
+def compile_course(course, lecture_range: str = "all"):
     """
     Update and compile master.tex for one course.
     """
     lectures = course.lectures
-    # "all" = include every lecture in this course
-    rng = lectures.parse_range_string("all")
+    rng = lectures.parse_range_string(lecture_range)
     lectures.update_lectures_in_master(rng)
     lectures.compile_master()
     print(f"[ok] Compiled {lectures.course.info['title']}")
@@ -32,10 +40,16 @@ def compile_course(course):
 
 def main():
     """
-    Iterate over all courses and compile their master files.
+    Iterate over all courses, compile their master files
+    and export the changed PDFs.
     """
-    for course in Courses():
-        compile_course(course)
+    lecture_range = sys.argv[1] if len(sys.argv) > 1 else "all"
+    courses = Courses()
+    for course in courses:
+        compile_course(course, lecture_range)
+
+    copied = export_pdfs(courses)
+    print(f"[ok] Exported {len(copied)} changed PDFs")
 
 
 if __name__ == "__main__":
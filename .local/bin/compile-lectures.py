@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+===============================================================
+ Script: compile-lectures.py
+ Author: Kris Yotam (aka. khr1st)
+ Date:   2026-10-19
+ License: MIT License
+ Description:
+   Builds one standalone PDF per lecture (out/lectures/lec_XX.pdf)
+   for reviewing on a phone. Only lectures whose source or the
+   course preamble changed are recompiled, in parallel.
+
+   Usage:
+     compile-lectures.py [RANGE] [--course SHORT] [-j JOBS]
+
+   RANGE is any lecture range understood by Lectures
+   (default: all).
+
+ Inspiration:
+   Adapted and extended from Gilles Castel's lecture note workflow.
+===============================================================
+"""
+
+import sys
+import argparse
+
+from courses import Courses
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile one PDF per lecture.")
+    parser.add_argument("range", nargs="?", default="all", help="lecture range (default: all)")
+    parser.add_argument("--course", help="course short name (default: current course)")
+    parser.add_argument("-j", "--jobs", type=int, help="parallel latexmk runs")
+    args = parser.parse_args()
+
+    courses = Courses()
+    if args.course:
+        course = next((c for c in courses if c.info["short"] == args.course), None)
+        if course is None:
+            sys.exit(f"[error] Unknown course: {args.course}")
+    else:
+        course = courses.current
+
+    lectures = course.lectures
+    codes = lectures.compile_standalone(lectures.parse_range_string(args.range), args.jobs)
+
+    failed = sorted(n for n, code in codes.items() if code)
+    print(f"[ok] Compiled {len(codes) - len(failed)} lectures of {course.info['title']}")
+    if failed:
+        print(f"[error] Failed: {', '.join(map(str, failed))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+===============================================================
+ Script: compilequeue.py
+ Author: Kris Yotam (aka. khr1st)
+ Date:   2026-10-19
+ License: MIT License
+ Description:
+   Coalescing background compile queue, one worker per course.
+   request_compile() records a new request generation in
+   <course>/.compile-request and makes sure a detached worker
+   runs. The worker compiles master.tex; if a newer request
+   arrives meanwhile, the running latexmk is cancelled and the
+   build restarts, so at most one build per course is ever
+   queued. The result is reported with notify-send.
+
+   Usage (worker, normally spawned by request_compile):
+     compilequeue.py COURSE_DIR
+
+ Inspiration:
+   Adapted and extended from Gilles Castel's lecture note workflow.
+===============================================================
+"""
+
+import os
+import sys
+import time
+import fcntl
+import subprocess
+from pathlib import Path
+
+from courses import Course
+
+REQUEST_FILE = ".compile-request"
+WORKER_LOCK = ".compile-worker.lock"
+
+
+# -----------------------------
+# Requests
+# -----------------------------
+
+def read_request(root: Path) -> str:
+    try:
+        return (root / REQUEST_FILE).read_text().strip()
+    except FileNotFoundError:
+        return ""
+
+
+def request_compile(root: Path):
+    """
+    Queue a compile of the course in root and return immediately.
+    Supersedes any pending or running compile of that course.
+    """
+    tmp = root / f"{REQUEST_FILE}.{os.getpid()}"
+    tmp.write_text(f"{time.time_ns()}\n")
+    os.replace(tmp, root / REQUEST_FILE)
+
+    # A worker that is already running picks the request up itself
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), str(root)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+# -----------------------------
+# Worker
+# -----------------------------
+
+def notify(title: str, code):
+    status = "ok" if code == 0 else f"failed (exit status {code})"
+    try:
+        subprocess.run(["notify-send", f"Compiled {title}", status])
+    except FileNotFoundError:
+        print(f"[{'ok' if code == 0 else 'error'}] Compiled {title}: {status}")
+
+
+def work(root: Path):
+    """
+    Compile until the latest request has been handled.
+    Returns without doing anything if another worker owns the course.
+    """
+    done = None
+    while True:
+        fd = os.open(root / WORKER_LOCK, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return
+
+        try:
+            while (request := read_request(root)) != done:
+                course = Course(root)
+                code = course.lectures.compile_master(
+                    cancelled=lambda: read_request(root) != request
+                )
+                if code is None:
+                    continue  # superseded by a newer request
+                done = request
+                if read_request(root) == request:
+                    notify(course.info["title"], code)
+        finally:
+            os.close(fd)
+
+        # A request written just before the lock was released would
+        # otherwise be left for a worker that already gave up
+        if read_request(root) == done:
+            return
+
+
+if __name__ == "__main__":
+    work(Path(sys.argv[1]))
@@ -15,6 +15,7 @@
 ===============================================================
 """
 
+import re
 from datetime import datetime
 from pathlib import Path
 
@@ -27,6 +28,10 @@ from pathlib import Path
 # Replace 'primary' with a calendar ID if using a dedicated course calendar.
 USERCALENDARID = "primary"
 
+# Local .ics file to use instead of Google Calendar (no OAuth/network).
+# e.g. Path("~/calendar/lectures.ics").expanduser()
+CALENDAR_ICS = None
+
 
 # -----------------------------
 # Course symlink and tracking
@@ -37,6 +42,26 @@ CURRENT_COURSE_ROOT = CURRENT_COURSE_SYMLINK.resolve()
 CURRENT_COURSE_WATCH_FILE = Path("/tmp/current_course").resolve()
 
 
+# -----------------------------
+# Status bar publishing
+# -----------------------------
+
+# countdown.py writes its latest line here; any number of bars read it.
+COUNTDOWN_STATUS_FILE = Path("/tmp/countdown")
+
+# dwmblocks signal (pkill -RTMIN+N) and polybar ipc module name to refresh.
+COUNTDOWN_SIGNAL = 14
+COUNTDOWN_POLYBAR_MODULE = "countdown"
+
+
+# -----------------------------
+# Editor
+# -----------------------------
+
+# Vim clientserver name used to open lectures
+VIM_SERVER = "kulak"
+
+
 # -----------------------------
 # Root directory for courses
 # -----------------------------
@@ -44,12 +69,67 @@ CURRENT_COURSE_WATCH_FILE = Path("/tmp/current_course").resolve()
 ROOT = Path("~/Documents/Kulak/bachelor_3/semester_2").expanduser()
 
 
+# -----------------------------
+# PDF export
+# -----------------------------
+
+# Compiled master.pdf files are mirrored here (e.g. a sync folder or share)
+PDF_EXPORT_DIR = Path("~/Sync/notes").expanduser()
+
+
+# -----------------------------
+# Menu ranking
+# -----------------------------
+
+# Open/compile events for frecency-ranked rofi menus
+FRECENCY_FILE = Path("~/.cache/lecture-frecency.json").expanduser()
+
+# Number of entries shown before falling back to "all"
+MENU_TOP_K = 5
+
+
+# -----------------------------
+# Build artifact cache
+# -----------------------------
+
+# Content-addressed cache of compiled PDFs + aux files, shared by all
+# checkouts on this machine. Least recently used entries are evicted
+# once the cache grows past BUILD_CACHE_LIMIT bytes.
+BUILD_CACHE_DIR = Path("~/.cache/lecture-builds").expanduser()
+BUILD_CACHE_LIMIT = 2 * 1024**3
+
+
 # -----------------------------
 # Date formatting
 # -----------------------------
 
 DATE_FORMAT = "%a %d %b %Y %H:%M"
 
+# Month abbreviations accepted by parse_date (English + Dutch),
+# so lecture headers parse regardless of the active LC_TIME.
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "mrt": 3, "apr": 4, "may": 5, "mei": 5,
+    "jun": 6, "jul": 7, "aug": 8, "sep": 9, "oct": 10, "okt": 10,
+    "nov": 11, "dec": 12,
+}
+
+DATE_PATTERN = re.compile(r"\S+\s+(\d{1,2})\s+([^\W\d_]+)\.?\s+(\d{4})\s+(\d{1,2}):(\d{2})")
+
+
+def parse_date(string: str) -> datetime:
+    """
+    Parse a DATE_FORMAT string without going through locale-dependent
+    strptime. Falls back to strptime for anything it does not recognise
+    (e.g. a customised DATE_FORMAT).
+    """
+    match = DATE_PATTERN.fullmatch(string.strip())
+    if match:
+        day, month, year, hour, minute = match.groups()
+        month = MONTHS.get(month[:3].lower())
+        if month:
+            return datetime(int(year), month, int(day), int(hour), int(minute))
+    return datetime.strptime(string, DATE_FORMAT)
+
 
 # -----------------------------
 # Week number utility
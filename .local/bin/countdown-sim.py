@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+===============================================================
+ Script: countdown-sim.py
+ Author: Kris Yotam (aka. khr1st)
+ Date:   2026-10-19
+ License: MIT License
+ Description:
+   Offline load harness for countdown.py.
+   Replays a full semester of events through a fake Google
+   Calendar service and runs countdown.run_day for every day
+   under a virtual clock (no sleeping, no network, no OAuth).
+   Reports output lines, published changes, wakeups, CPU time
+   per simulated day, calendar fetches and course activations,
+   plus boundary checks. --dump writes every line with its
+   timestamp, so scheduling changes can be diffed.
+
+   Usage:
+     countdown-sim.py [--ics FILE] [--start 2026-02-09] [--weeks 13]
+                      [--wake 07:00] [--dump lines.txt]
+
+   Without --ics a synthetic timetable is generated (five
+   courses, back-to-back slots and a lecture past midnight).
+
+ Inspiration:
+   Adapted and extended from Gilles Castel's lecture note workflow.
+===============================================================
+"""
+
+import time
+import sched
+import argparse
+import datetime
+from collections import Counter
+
+import pytz
+
+import countdown
+from ics import IcsCalendar
+
+TZ = pytz.timezone("Europe/Brussels")
+
+
+# -----------------------------
+# Virtual clock
+# -----------------------------
+
+class VirtualClock:
+    """
+    time/sleep pair for sched.scheduler; sleeping advances the clock.
+    """
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+        self.wakeups = 0
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            self.now += seconds
+            self.wakeups += 1
+
+
+# -----------------------------
+# Fake calendar service
+# -----------------------------
+
+class FakeService:
+    """
+    Minimal stand-in for googleapiclient's calendar service:
+    service.events().list(timeMin=..., timeMax=...).execute()
+    """
+
+    def __init__(self, events):
+        self.items = [
+            {
+                "summary": e["summary"],
+                "location": e["location"],
+                "start": {"dateTime": e["start"].isoformat()},
+                "end": {"dateTime": e["end"].isoformat()},
+            }
+            for e in events
+        ]
+        self.starts = [e["start"] for e in events]
+        self.ends = [e["end"] for e in events]
+        self.fetches = 0
+        self._query = None
+
+    def events(self):
+        return self
+
+    def list(self, timeMin, timeMax, **kwargs):
+        self._query = (
+            datetime.datetime.fromisoformat(timeMin),
+            datetime.datetime.fromisoformat(timeMax),
+        )
+        return self
+
+    def execute(self):
+        self.fetches += 1
+        lo, hi = self._query
+        return {"items": [
+            item for item, start, end in zip(self.items, self.starts, self.ends)
+            if end > lo and start < hi
+        ]}
+
+
+def synthetic_semester(start: datetime.date, weeks: int):
+    """
+    Five courses with two weekly slots each, including back-to-back
+    lectures and one lecture crossing midnight.
+    """
+    slots = [
+        # (course, weekday, hour, minute, minutes)
+        (0, 0, 8, 30, 120), (1, 0, 10, 30, 120),    # back to back
+        (2, 1, 13, 0, 90), (3, 1, 16, 0, 120),      # with a break
+        (4, 2, 9, 0, 60), (0, 2, 11, 0, 90),
+        (1, 3, 14, 0, 120), (2, 3, 16, 0, 60),
+        (3, 4, 8, 0, 90), (4, 4, 23, 0, 90),        # past midnight
+    ]
+    events = []
+    for week in range(weeks):
+        monday = start - datetime.timedelta(days=start.weekday()) + datetime.timedelta(weeks=week)
+        for course, weekday, hour, minute, minutes in slots:
+            day = monday + datetime.timedelta(days=weekday)
+            begin = TZ.localize(datetime.datetime(day.year, day.month, day.day, hour, minute))
+            events.append({
+                "summary": f"Course {course} X{week:02d}",
+                "location": f"Aula (B10{course})",
+                "start": begin,
+                "end": begin + datetime.timedelta(minutes=minutes),
+            })
+    return sorted(events, key=lambda e: e["start"])
+
+
+# -----------------------------
+# Simulation
+# -----------------------------
+
+def simulate(events, start: datetime.date, days: int, wake: datetime.time, dump=None):
+    service = FakeService(events)
+    activations = Counter()
+    cpu, wakeups, lines, changes, zero = [], [], 0, 0, 0
+
+    for offset in range(days):
+        day = start + datetime.timedelta(days=offset)
+        clock = VirtualClock(TZ.localize(datetime.datetime.combine(day, wake)).timestamp())
+        scheduler = sched.scheduler(clock.time, clock.sleep)
+        day_lines = []
+
+        def output(line, changed):
+            day_lines.append((clock.now, line, changed))
+
+        def activate(event):
+            activations[event["summary"].split(" X")[0]] += 1
+
+        source = countdown.GoogleCalendar(service=service)
+        began = time.process_time()
+        countdown.run_day(source, scheduler, TZ, output=output, activate=activate)
+        cpu.append(time.process_time() - began)
+        wakeups.append(clock.wakeups)
+
+        lines += len(day_lines)
+        changes += sum(changed for _, _, changed in day_lines)
+        zero += sum(" 0 min" in line for _, line, _ in day_lines)
+        if dump:
+            for stamp, line, _ in day_lines:
+                dump.write(f"{datetime.datetime.fromtimestamp(stamp, TZ):%Y-%m-%d %H:%M:%S}\t{line}\n")
+
+    return {
+        "days": days,
+        "events": len(events),
+        "lines": lines,
+        "changes": changes,
+        "wakeups": wakeups,
+        "cpu": cpu,
+        "fetches": service.fetches,
+        "activations": activations,
+        "zero_countdowns": zero,
+    }
+
+
+def print_report(report):
+    days = report["days"]
+    print(f"simulated days      {days}")
+    print(f"events              {report['events']}")
+    print(f"calendar fetches    {report['fetches']}")
+    print(f"output lines        {report['lines']} ({report['lines'] / days:.0f}/day)")
+    print(f"published changes   {report['changes']} ({report['changes'] / days:.0f}/day)")
+    print(f"wakeups             {sum(report['wakeups'])} (max {max(report['wakeups'])}/day)")
+    print(f"cpu per day         {1000 * sum(report['cpu']) / days:.1f} ms "
+          f"(max {1000 * max(report['cpu']):.1f} ms)")
+    print(f"'0 min' countdowns  {report['zero_countdowns']}")
+    print("activations")
+    for course, count in sorted(report["activations"].items()):
+        print(f"  {course:<16}{count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate countdown.py over a semester.")
+    parser.add_argument("--ics", help="replay events from an .ics file")
+    parser.add_argument("--start", type=datetime.date.fromisoformat, default=datetime.date(2026, 2, 9))
+    parser.add_argument("--weeks", type=int, default=13)
+    parser.add_argument("--wake", type=datetime.time.fromisoformat, default=datetime.time(7, 0))
+    parser.add_argument("--dump", type=argparse.FileType("w"), help="write all lines here")
+    args = parser.parse_args()
+
+    days = 7 * args.weeks
+    if args.ics:
+        begin = TZ.localize(datetime.datetime.combine(args.start, datetime.time()))
+        events = IcsCalendar(args.ics).events(begin, begin + datetime.timedelta(days=days + 1))
+    else:
+        events = synthetic_semester(args.start, args.weeks)
+
+    print_report(simulate(events, args.start, days, args.wake, args.dump))
+
+
+if __name__ == "__main__":
+    main()
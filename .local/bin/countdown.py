@@ -6,10 +6,20 @@
  Date:   2025-09-29
  License: MIT License
  Description:
-   Hooks into Google Calendar to display upcoming/current lecture
-   info. Updates the active course when matching an event.
+   Hooks into Google Calendar (or a local .ics file, see
+   CALENDAR_ICS) to display upcoming/current lecture info.
+   Updates the active course when matching an event.
    Designed for use with polybar or similar status bars.
 
+   The current line is printed to stdout and also published once
+   to COUNTDOWN_STATUS_FILE, after which dwmblocks (sb-countdown)
+   and polybar ipc modules are signalled to re-read it:
+
+     [module/countdown]
+     type = custom/ipc
+     hook-0 = cat /tmp/countdown
+     initial = 1
+
  Inspiration:
    Adapted and extended from Gilles Castel's lecture note workflow.
 ===============================================================
@@ -22,20 +32,24 @@ import math
 import sched
 import time
 import pickle
+import subprocess
 import datetime
 import pytz
 import http.client as httplib
 from dateutil.parser import parse
 
-from googleapiclient.discovery import build
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-
+from ics import IcsCalendar
 from courses import Courses
-from config import USERCALENDARID
+from config import (
+    USERCALENDARID,
+    CALENDAR_ICS,
+    COUNTDOWN_STATUS_FILE,
+    COUNTDOWN_SIGNAL,
+    COUNTDOWN_POLYBAR_MODULE,
+)
 
-# Global: list of courses
-courses = Courses()
+# Global: list of courses (loaded on first course activation)
+courses = None
 
 
 # -----------------------------
@@ -47,6 +61,10 @@ def authenticate():
     Authenticate with Google Calendar API, return service object.
     Caches token in token.pickle for reuse.
     """
+    from googleapiclient.discovery import build
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.auth.transport.requests import Request
+
     SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
     creds = None
 
@@ -165,6 +183,10 @@ def activate_course(event):
     """
     Match event summary with course title and set current course.
     """
+    global courses
+    if courses is None:
+        courses = Courses()
+
     course = next(
         (c for c in courses if c.info["title"].lower() in event["summary"].lower()),
         None,
@@ -201,6 +223,57 @@ def get_events(service, calendar, morning, evening):
     ]
 
 
+class GoogleCalendar:
+    """
+    Google Calendar event source. Each window is fetched once,
+    so callers can ask for events on every tick.
+    """
+
+    def __init__(self, calendar=USERCALENDARID, service=None):
+        self.service = service or authenticate()
+        self.calendar = calendar
+        self._windows = {}
+
+    def events(self, start, end):
+        key = (start, end)
+        if key not in self._windows:
+            self._windows = {key: get_events(self.service, self.calendar, start, end)}
+        return self._windows[key]
+
+
+def make_source():
+    """
+    Local .ics file if CALENDAR_ICS is set, Google Calendar otherwise.
+    """
+    if CALENDAR_ICS:
+        return IcsCalendar(CALENDAR_ICS)
+    return GoogleCalendar()
+
+
+# -----------------------------
+# Publishing
+# -----------------------------
+
+def publish(line):
+    """
+    Write the status line atomically to COUNTDOWN_STATUS_FILE and
+    signal status bars to re-read it. Bars that are not running
+    are silently ignored.
+    """
+    tmp = COUNTDOWN_STATUS_FILE.with_name(COUNTDOWN_STATUS_FILE.name + ".tmp")
+    tmp.write_text(line + "\n")
+    os.replace(tmp, COUNTDOWN_STATUS_FILE)
+
+    for cmd in (
+        ["pkill", f"-RTMIN+{COUNTDOWN_SIGNAL}", os.environ.get("STATUSBAR", "dwmblocks")],
+        ["polybar-msg", "action", f"#{COUNTDOWN_POLYBAR_MODULE}.hook.0"],
+    ):
+        try:
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except FileNotFoundError:
+            pass
+
+
 # -----------------------------
 # Network helper
 # -----------------------------
@@ -223,38 +296,61 @@ def wait_for_internet_connection(url, timeout=5):
 # Main
 # -----------------------------
 
-def main():
-    scheduler = sched.scheduler(time.time, time.sleep)
-
-    tz = pytz.timezone(os.environ.get("TZ", "Europe/Brussels"))
+def show(line, changed):
+    """
+    Default output: print every tick, publish only changes.
+    """
+    print(line, flush=True)
+    if changed:
+        publish(line)
 
-    service = authenticate()
 
-    now = datetime.datetime.now(tz=tz)
+def run_day(source, scheduler, tz, output=show, activate=activate_course):
+    """
+    Run one day of countdown output on scheduler.
+    All times come from scheduler.timefunc, so a virtual clock
+    can drive it (see countdown-sim.py).
+    """
+    now = datetime.datetime.fromtimestamp(scheduler.timefunc(), tz=tz)
     morning = now.replace(hour=6, minute=0, microsecond=0)
     evening = now.replace(hour=23, minute=59, microsecond=0)
 
-    events = get_events(service, USERCALENDARID, morning, evening)
+    events = source.events(morning, evening)
 
     DELAY = 60
+    last_line = None
 
     def print_message():
-        now = datetime.datetime.now(tz=tz)
-        print(event_text(events, now))
+        nonlocal last_line, events
+        now = datetime.datetime.fromtimestamp(scheduler.timefunc(), tz=tz)
+        # Cheap: sources cache per window (.ics re-parses only on change)
+        events = source.events(morning, evening)
+        line = event_text(events, now)
+        output(line, line != last_line)
+        last_line = line
         if now < evening:
             scheduler.enter(DELAY, 1, print_message)
 
     for event in events:
         scheduler.enterabs(
-            event["start"].timestamp(), 1, activate_course, argument=(event,)
+            event["start"].timestamp(), 1, activate, argument=(event,)
         )
 
     scheduler.enter(0, 1, print_message)
     scheduler.run()
 
 
+def main():
+    scheduler = sched.scheduler(time.time, time.sleep)
+
+    tz = pytz.timezone(os.environ.get("TZ", "Europe/Brussels"))
+
+    run_day(make_source(), scheduler, tz)
+
+
 if __name__ == "__main__":
     os.chdir(sys.path[0])
-    print("Waiting for connection...")
-    wait_for_internet_connection("www.google.com")
+    if not CALENDAR_ICS:
+        print("Waiting for connection...")
+        wait_for_internet_connection("www.google.com")
     main()
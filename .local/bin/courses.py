@@ -16,9 +16,11 @@
 ===============================================================
 """
 
+import os
 from pathlib import Path
 import yaml
 
+import frecency
 from lectures import Lectures
 from config import (
     ROOT,
@@ -61,36 +63,61 @@ class Course:
         return self.path == other.path
 
 
+# -----------------------------
+# Course lookup helpers
+# -----------------------------
+
+def course_paths() -> list:
+    """
+    Course directories in ROOT, sorted by name, without loading them.
+    """
+    return sorted((x for x in ROOT.iterdir() if x.is_dir()), key=lambda p: p.name)
+
+
+def current_course() -> Course:
+    """
+    Return the currently active course without scanning ROOT.
+    """
+    return Course(CURRENT_COURSE_ROOT.resolve())
+
+
 # -----------------------------
 # Courses collection
 # -----------------------------
 
 class Courses(list):
-    def __init__(self):
-        super().__init__(self.read_files())
+    def __init__(self, paths=None):
+        super().__init__(self.read_files(paths))
 
-    def read_files(self):
+    def read_files(self, paths=None):
         """
-        Scan ROOT for course directories and return Course objects.
+        Return Course objects for the given directories, in order,
+        or for every course directory in ROOT (sorted by name).
         """
-        course_dirs = [x for x in ROOT.iterdir() if x.is_dir()]
-        courses = [Course(path) for path in course_dirs]
-        return sorted(courses, key=lambda c: c.name)
+        if paths is None:
+            paths = course_paths()
+        return [Course(path) for path in paths]
 
     @property
     def current(self) -> Course:
         """
         Return the currently active course.
         """
-        return Course(CURRENT_COURSE_ROOT.resolve())
+        return current_course()
 
     @current.setter
     def current(self, course: Course):
         """
         Set the current course by updating symlink and watch file.
+        Both are replaced atomically (temp + rename), so readers never
+        see a missing course.
         """
-        if CURRENT_COURSE_SYMLINK.exists() or CURRENT_COURSE_SYMLINK.is_symlink():
-            CURRENT_COURSE_SYMLINK.unlink()
-
-        CURRENT_COURSE_SYMLINK.symlink_to(course.path)
-        CURRENT_COURSE_WATCH_FILE.write_text(f"{course.info['short']}\n")
+        tmp_link = CURRENT_COURSE_SYMLINK.with_name(f".{CURRENT_COURSE_SYMLINK.name}.{os.getpid()}")
+        tmp_link.unlink(missing_ok=True)
+        tmp_link.symlink_to(course.path)
+        os.replace(tmp_link, CURRENT_COURSE_SYMLINK)
+
+        tmp_watch = CURRENT_COURSE_WATCH_FILE.with_name(f".{CURRENT_COURSE_WATCH_FILE.name}.{os.getpid()}")
+        tmp_watch.write_text(f"{course.info['short']}\n")
+        os.replace(tmp_watch, CURRENT_COURSE_WATCH_FILE)
+        frecency.record(course.path.resolve())
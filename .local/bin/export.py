@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+===============================================================
+ Script: export.py
+ Author: Kris Yotam (aka. khr1st)
+ Date:   2026-10-19
+ License: MIT License
+ Description:
+   Mirrors each course's compiled out/master.pdf to
+   PDF_EXPORT_DIR (a sync folder, mounted share, ...).
+   A manifest in the target directory remembers the hash of
+   every exported PDF, so only changed PDFs are copied.
+   Copies are atomic (temp file + rename) and run in parallel;
+   PDFs of courses that no longer exist are pruned.
+
+ Inspiration:
+   Adapted and extended from Gilles Castel's lecture note workflow.
+===============================================================
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from courses import Courses
+from config import PDF_EXPORT_DIR
+
+MANIFEST_NAME = ".manifest.json"
+
+
+# -----------------------------
+# Helpers
+# -----------------------------
+
+def master_pdf(course) -> Path:
+    """Compiled master.pdf of a course (latexmk $out_dir = "out")."""
+    return course.path / "out" / "master.pdf"
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def atomic_copy(src: Path, dst: Path):
+    """
+    Copy src to dst through a temp file in dst's directory,
+    so readers never see a half-written PDF.
+    """
+    fd, tmp = tempfile.mkstemp(dir=dst.parent, prefix=f".{dst.name}.")
+    try:
+        with os.fdopen(fd, "wb") as out, src.open("rb") as f:
+            shutil.copyfileobj(f, out)
+        os.replace(tmp, dst)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_manifest(target: Path) -> dict:
+    try:
+        return json.loads((target / MANIFEST_NAME).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(target: Path, manifest: dict):
+    path = target / MANIFEST_NAME
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp, path)
+
+
+# -----------------------------
+# Export
+# -----------------------------
+
+def export_course(course, target: Path, entry: dict):
+    """
+    Export one course's PDF if it changed. Returns (name, entry, copied).
+    Hashing is skipped when size and mtime match the manifest.
+    """
+    src = master_pdf(course)
+    dst = target / f"{course.name}.pdf"
+    stat = src.stat()
+
+    if entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime_ns and dst.exists():
+        return course.name, entry, False
+
+    new_entry = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "sha256": file_hash(src)}
+    if new_entry["sha256"] == entry.get("sha256") and dst.exists():
+        return course.name, new_entry, False
+
+    atomic_copy(src, dst)
+    return course.name, new_entry, True
+
+
+def export_pdfs(courses, target: Path = PDF_EXPORT_DIR, workers: int = 4):
+    """
+    Export all compiled course PDFs to target and prune stale ones.
+    Returns the list of course names whose PDF was copied.
+    """
+    target.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(target)
+    compiled = [c for c in courses if master_pdf(c).exists()]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(
+            lambda c: export_course(c, target, manifest.get(c.name, {})), compiled
+        ))
+
+    known = {c.name for c in courses}
+    for name in set(manifest) - known:
+        (target / f"{name}.pdf").unlink(missing_ok=True)
+
+    new_manifest = {name: manifest[name] for name in manifest if name in known}
+    new_manifest.update({name: entry for name, entry, _ in results})
+    save_manifest(target, new_manifest)
+
+    return [name for name, _, copied in results if copied]
+
+
+def main():
+    copied = export_pdfs(Courses())
+    print(f"[ok] Exported {len(copied)} PDFs to {PDF_EXPORT_DIR}")
+
+
+if __name__ == "__main__":
+    main()
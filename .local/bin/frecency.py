@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+===============================================================
+ Script: frecency.py
+ Author: Kris Yotam (aka. khr1st)
+ Date:   2026-10-19
+ License: MIT License
+ Description:
+   Small frecency store for rofi menus.
+   Every open/compile event bumps a key (a course or lecture
+   path); scores decay exponentially with a one week half-life.
+   Menus rank their entries with `rank` and only show the top K.
+
+ Inspiration:
+   Adapted and extended from Gilles Castel's lecture note workflow.
+===============================================================
+"""
+
+import os
+import json
+import time
+
+from config import FRECENCY_FILE
+
+HALF_LIFE = 7 * 24 * 3600
+
+# Entries below this (decayed) score are dropped when saving
+MIN_SCORE = 0.01
+MAX_ENTRIES = 500
+
+
+# -----------------------------
+# Storage
+# -----------------------------
+
+def load() -> dict:
+    """
+    Return {key: [score, timestamp]}.
+    """
+    try:
+        return json.loads(FRECENCY_FILE.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save(data: dict):
+    """
+    Atomically write the store, keeping only the strongest entries.
+    """
+    now = time.time()
+    kept = sorted(data.items(), key=lambda kv: -decayed(kv[1], now))[:MAX_ENTRIES]
+    data = {k: v for k, v in kept if decayed(v, now) >= MIN_SCORE}
+
+    FRECENCY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = FRECENCY_FILE.with_name(f".{FRECENCY_FILE.name}.{os.getpid()}")
+    tmp.write_text(json.dumps(data, separators=(",", ":")))
+    os.replace(tmp, FRECENCY_FILE)
+
+
+# -----------------------------
+# Scoring
+# -----------------------------
+
+def decayed(entry, now: float) -> float:
+    score, stamp = entry
+    return score * 0.5 ** ((now - stamp) / HALF_LIFE)
+
+
+def record(key) -> None:
+    """
+    Register one open/compile event for key.
+    """
+    key = str(key)
+    now = time.time()
+    data = load()
+    data[key] = [decayed(data.get(key, [0.0, now]), now) + 1.0, now]
+    save(data)
+
+
+def rank(keys: list) -> list:
+    """
+    Sort keys by descending frecency. Ties (e.g. never used)
+    keep their original order, so callers pass their fallback order.
+    """
+    now = time.time()
+    data = load()
+    return sorted(keys, key=lambda k: -decayed(data[str(k)], now) if str(k) in data else 0.0)
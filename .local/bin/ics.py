@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+===============================================================
+ Script: ics.py
+ Author: Kris Yotam (aka. khr1st)
+ Date:   2026-10-19
+ License: MIT License
+ Description:
+   Minimal reader for iCalendar (.ics) files.
+   Turns VEVENT blocks into the same event dicts that
+   countdown.get_events returns (summary, location, start, end).
+   Only timed events are returned; all-day events are skipped.
+
+   IcsCalendar is a local event source for countdown.py: it
+   re-parses the file only when it changes, expands DAILY and
+   WEEKLY recurrences (INTERVAL, COUNT, UNTIL, BYDAY, EXDATE,
+   RECURRENCE-ID overrides) and caches the expansion per window.
+
+ Inspiration:
+   Adapted and extended from Gilles Castel's lecture note workflow.
+===============================================================
+"""
+
+import os
+from functools import lru_cache
+from datetime import datetime, time, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+WEEKDAYS = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+
+# Number of expanded windows kept per calendar
+WINDOW_CACHE_SIZE = 8
+
+
+# -----------------------------
+# Timezone helpers
+# -----------------------------
+
+def local_zone():
+    """
+    The local timezone as a ZoneInfo ($TZ, else /etc/localtime), so
+    floating times keep their wall-clock time across DST changes.
+    Falls back to the current fixed offset if neither is available.
+    """
+    return zone_for(os.environ.get("TZ", "").lstrip(":"))
+
+
+@lru_cache(maxsize=None)
+def zone_for(name: str):
+    try:
+        if name:
+            return ZoneInfo(name)
+        with open("/etc/localtime", "rb") as f:
+            return ZoneInfo.from_file(f, key="localtime")
+    except (OSError, ValueError, ZoneInfoNotFoundError):
+        return datetime.now().astimezone().tzinfo
+
+
+# -----------------------------
+# Line helpers
+# -----------------------------
+
+def unfold(text: str):
+    """
+    Undo RFC 5545 line folding (continuation lines start with
+    a space or tab) and yield logical content lines.
+    """
+    line = None
+    for raw in text.splitlines():
+        if raw[:1] in (" ", "\t") and line is not None:
+            line += raw[1:]
+            continue
+        if line is not None:
+            yield line
+        line = raw
+    if line is not None:
+        yield line
+
+
+def split_line(line: str):
+    """
+    Split 'NAME;PARAM=X:value' into (name, params, value).
+    """
+    head, _, value = line.partition(":")
+    name, *params = head.split(";")
+    params = dict(p.split("=", 1) for p in params if "=" in p)
+    return name.upper(), params, value
+
+
+def unescape(value: str) -> str:
+    return (
+        value.replace("\\n", "\n").replace("\\N", "\n")
+        .replace("\\,", ",").replace("\\;", ";").replace("\\\\", "\\")
+    )
+
+
+def parse_datetime(value: str, params: dict):
+    """
+    Parse a DTSTART/DTEND value into an aware datetime.
+    Returns None for all-day (VALUE=DATE) values.
+    Floating times are interpreted in the local timezone
+    (wall-clock, so recurrences follow DST).
+    """
+    if params.get("VALUE") == "DATE" or "T" not in value:
+        return None
+    if value.endswith("Z"):
+        return datetime.strptime(value[:-1], "%Y%m%dT%H%M%S").replace(tzinfo=timezone.utc)
+    date = datetime.strptime(value, "%Y%m%dT%H%M%S")
+    if "TZID" in params:
+        return date.replace(tzinfo=ZoneInfo(params["TZID"].strip('"')))
+    return date.replace(tzinfo=local_zone())
+
+
+def parse_rrule(value: str) -> dict:
+    """
+    Parse 'FREQ=WEEKLY;BYDAY=MO,WE;COUNT=13' into a dict.
+    """
+    return dict(part.split("=", 1) for part in value.split(";") if "=" in part)
+
+
+# -----------------------------
+# Event reading
+# -----------------------------
+
+def parse_events(text: str):
+    """
+    Parse all timed VEVENTs in an .ics string, sorted by start.
+    Recurring events keep their rule under the private keys
+    '_rrule', '_exdates', '_uid' and '_recurrence_id'.
+    """
+    events = []
+    event = None
+    for line in unfold(text):
+        name, params, value = split_line(line)
+        if name == "BEGIN" and value.upper() == "VEVENT":
+            event = {"summary": "", "location": None, "start": None, "end": None,
+                     "_uid": None, "_rrule": None, "_exdates": set(), "_recurrence_id": None}
+        elif name == "END" and value.upper() == "VEVENT":
+            if event and event["start"]:
+                event["end"] = event["end"] or event["start"]
+                events.append(event)
+            event = None
+        elif event is not None:
+            if name == "SUMMARY":
+                event["summary"] = unescape(value)
+            elif name == "LOCATION":
+                event["location"] = unescape(value)
+            elif name == "DTSTART":
+                event["start"] = parse_datetime(value, params)
+            elif name == "DTEND":
+                event["end"] = parse_datetime(value, params)
+            elif name == "UID":
+                event["_uid"] = value
+            elif name == "RRULE":
+                event["_rrule"] = parse_rrule(value)
+            elif name == "EXDATE":
+                event["_exdates"].update(
+                    parse_datetime(v, params) for v in value.split(",")
+                )
+            elif name == "RECURRENCE-ID":
+                event["_recurrence_id"] = parse_datetime(value, params)
+    return sorted(events, key=lambda e: e["start"])
+
+
+def public(event, start=None):
+    """
+    Strip private keys; optionally move the event to a new start.
+    """
+    duration = event["end"] - event["start"]
+    start = start or event["start"]
+    return {
+        "summary": event["summary"],
+        "location": event["location"],
+        "start": start,
+        "end": start + duration,
+    }
+
+
+def parse_until(value: str, tzinfo):
+    """
+    Parse an RRULE UNTIL value. A date-only UNTIL includes that whole
+    day in the event's timezone.
+    """
+    if "T" not in value:
+        day = datetime.strptime(value, "%Y%m%d").date()
+        return datetime.combine(day, time.max, tzinfo=tzinfo)
+    return parse_datetime(value, {})
+
+
+def occurrences(event, window_end: datetime):
+    """
+    Yield start datetimes of a (possibly recurring) event up to window_end.
+    Unsupported frequencies yield only the first occurrence.
+    """
+    rule = event["_rrule"]
+    first = event["start"]
+    if not rule or rule.get("FREQ") not in ("DAILY", "WEEKLY"):
+        yield first
+        return
+
+    interval = int(rule.get("INTERVAL", 1))
+    count = int(rule["COUNT"]) if "COUNT" in rule else None
+    until = parse_until(rule["UNTIL"], first.tzinfo) if "UNTIL" in rule else None
+
+    if rule["FREQ"] == "DAILY":
+        step, offsets = timedelta(days=interval), [0]
+    else:
+        days = [WEEKDAYS.index(d[-2:]) for d in rule.get("BYDAY", WEEKDAYS[first.weekday()]).split(",")]
+        # Offsets relative to the Monday of the first week
+        step, offsets = timedelta(weeks=interval), sorted(days)
+
+    period = first - timedelta(days=first.weekday()) if rule["FREQ"] == "WEEKLY" else first
+    produced = 0
+    while period <= window_end:
+        for offset in offsets:
+            start = period + timedelta(days=offset)
+            if start < first:
+                continue
+            if (until and start > until) or (count is not None and produced >= count):
+                return
+            if start > window_end:
+                return
+            produced += 1
+            yield start
+        period += step
+
+
+def expand(events, start: datetime, end: datetime):
+    """
+    Expand recurring events and return occurrences overlapping
+    [start, end), sorted by start.
+    """
+    overrides = {(e["_uid"], e["_recurrence_id"]) for e in events if e["_recurrence_id"]}
+    result = []
+    for event in events:
+        if event["_recurrence_id"]:
+            occurrence_starts = [event["start"]]
+        else:
+            occurrence_starts = occurrences(event, end)
+        for occ in occurrence_starts:
+            if occ in event["_exdates"] or (not event["_recurrence_id"] and (event["_uid"], occ) in overrides):
+                continue
+            occ_event = public(event, occ)
+            if occ_event["end"] > start and occ_event["start"] < end:
+                result.append(occ_event)
+    return sorted(result, key=lambda e: e["start"])
+
+
+# -----------------------------
+# Event source
+# -----------------------------
+
+class IcsCalendar:
+    """
+    Local .ics event source with the same interface as
+    countdown.GoogleCalendar: events(start, end) -> list of dicts.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path).expanduser()
+        self._stamp = None
+        self._events = []
+        self._windows = {}
+
+    def refresh(self):
+        """
+        Re-parse the file only if its size or mtime changed.
+        """
+        stat = self.path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self._stamp:
+            self._events = parse_events(self.path.read_text())
+            self._windows.clear()
+            self._stamp = stamp
+
+    def events(self, start: datetime, end: datetime):
+        self.refresh()
+        key = (start, end)
+        if key not in self._windows:
+            if len(self._windows) >= WINDOW_CACHE_SIZE:
+                self._windows.pop(next(iter(self._windows)))
+            self._windows[key] = expand(self._events, start, end)
+        return self._windows[key]
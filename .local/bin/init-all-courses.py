@@ -9,13 +9,24 @@
    Initializes LaTeX note-taking course directories by
    creating `master.tex`, `master.tex.latexmain`, and
    ensuring `figures/` exists for each course.
+   Idempotent: only missing pieces are created and master.tex is
+   rewritten only when its skeleton changed (the lecture list is
+   kept). --dry-run prints a per-course diff instead.
 
  Inspiration:
    Adapted and extended from Gilles Castel's lecture note workflow.
 ===============================================================
 """
 
+import os
+import difflib
+import argparse
+from pathlib import Path
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+
 from courses import Courses
+from lectures import course_lock
 
 
 def build_master_content(course_title: str) -> str:
@@ -36,33 +47,102 @@ def build_master_content(course_title: str) -> str:
     return '\n'.join(lines)
 
 
-def init_course(course):
+def split_master(text: str):
+    """
+    Split master.tex text into (header, body, footer) around the
+    '% start lectures' / '% end lectures' markers.
+    Returns None if the markers are missing.
+    """
+    lines = text.splitlines(keepends=True)
+    try:
+        start = next(i for i, l in enumerate(lines) if "start lectures" in l)
+        end = next(i for i, l in enumerate(lines) if "end lectures" in l and i > start)
+    except StopIteration:
+        return None
+    return "".join(lines[: start + 1]), "".join(lines[start + 1 : end]), "".join(lines[end:])
+
+
+def plan_master(master_file: Path, course_title: str):
+    """
+    Return (old, new) master.tex contents. The skeleton is taken from
+    build_master_content, the lecture list from the existing file.
+    new is None when the file cannot be merged (no markers).
+    """
+    skeleton = build_master_content(course_title)
+    if not master_file.exists():
+        return "", skeleton
+
+    old = master_file.read_text()
+    parts = split_master(old)
+    if parts is None:
+        return old, None
+
+    header, _, footer = split_master(skeleton)
+    return old, header + parts[1] + footer
+
+
+def init_course(course, dry_run: bool = False):
     """
     Initialize one course directory with master.tex,
     .latexmain marker, and figures/ folder.
+    Only missing or outdated pieces are written; returns a
+    report string (a unified diff in dry-run mode).
     """
-    lectures = course.lectures
-    course_title = lectures.course.info["title"]
+    course_title = course.info["title"]
+    root = course.path
+    master_file = root / "master.tex"
+    latexmain = root / "master.tex.latexmain"
+    figures = root / "figures"
 
-    # Write master.tex with minimal skeleton
-    lectures.master_file.touch(exist_ok=True)
-    lectures.master_file.write_text(build_master_content(course_title))
+    # A dry run only reads, so it must not create <course>/.lock either
+    with nullcontext() if dry_run else course_lock(root):
+        old, new = plan_master(master_file, course_title)
+        if new is None:
+            return f"[warn] {course_title}: master.tex has no lecture markers, left untouched"
 
-    # Touch helper file for latexmk integration
-    (lectures.root / 'master.tex.latexmain').touch(exist_ok=True)
+        actions = []
+        if old != new:
+            actions.append("master.tex" if old else "master.tex (new)")
+        if not latexmain.exists():
+            actions.append(latexmain.name)
+        if not figures.is_dir():
+            actions.append("figures/")
 
-    # Ensure figures directory exists
-    (lectures.root / 'figures').mkdir(exist_ok=True)
+        if not actions:
+            return f"[skip] {course_title} is up to date"
 
-    print(f"[ok] Initialized {course_title}")
+        if dry_run:
+            diff = difflib.unified_diff(
+                old.splitlines(keepends=True),
+                new.splitlines(keepends=True),
+                fromfile=str(master_file),
+                tofile=str(master_file),
+            )
+            return f"[dry-run] {course_title}: {', '.join(actions)}\n" + "".join(diff)
+
+        if old != new:
+            tmp = master_file.with_name(".master.tex.tmp")
+            tmp.write_text(new)
+            os.replace(tmp, master_file)
+        if not latexmain.exists():
+            latexmain.touch()
+        figures.mkdir(exist_ok=True)
+
+        return f"[ok] Initialized {course_title}: {', '.join(actions)}"
 
 
 def main():
     """
-    Iterate over all courses and initialize them.
+    Initialize all courses concurrently, print reports in course order.
     """
-    for course in Courses():
-        init_course(course)
+    parser = argparse.ArgumentParser(description="Initialize course directories.")
+    parser.add_argument("--dry-run", action="store_true", help="show what would change")
+    parser.add_argument("-j", "--jobs", type=int, default=8, help="parallel workers")
+    args = parser.parse_args()
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        for report in pool.map(lambda c: init_course(c, args.dry_run), Courses()):
+            print(report)
 
 
 if __name__ == "__main__":
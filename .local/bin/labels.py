@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+===============================================================
+ Script: labels.py
+ Author: Kris Yotam (aka. khr1st)
+ Date:   2026-10-19
+ License: MIT License
+ Description:
+   Cross-lecture \label / \ref index for one course.
+   Maps every label to its lecture, line and environment and
+   records every reference. The index is cached in
+   <course>/.labels.json and only lectures whose mtime changed
+   are re-scanned, so queries take milliseconds.
+
+   Usage:
+     labels.py list [PREFIX]   # label<TAB>lecture:line<TAB>env
+     labels.py check           # duplicate + undefined labels
+     labels.py ... --course SHORT
+
+   `check` exits with status 1 when problems are found, so it
+   can run before a compile.
+
+ Inspiration:
+   Adapted and extended from Gilles Castel's lecture note workflow.
+===============================================================
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+from pathlib import Path
+
+from courses import Courses, current_course
+from lectures import filename2number
+
+INDEX_FILE = ".labels.json"
+
+LABEL_RE = re.compile(r"\\label\{([^}]*)\}")
+REF_RE = re.compile(r"\\(?:ref|eqref|pageref|autoref|cref|Cref)\{([^}]*)\}")
+ENV_RE = re.compile(r"\\(begin|end)\{([^}]*)\}")
+COMMENT_RE = re.compile(r"(?<!\\)%.*")
+
+
+# -----------------------------
+# Scanning
+# -----------------------------
+
+def scan_file(path: Path) -> dict:
+    """
+    Return {"labels": [[label, line, env]], "refs": [[label, line]]}
+    for one lecture file. env is the innermost open environment.
+    """
+    labels, refs, envs = [], [], []
+    with path.open() as f:
+        for number, line in enumerate(f, start=1):
+            line = COMMENT_RE.sub("", line)
+            events = sorted(
+                [(m.start(), "env", m) for m in ENV_RE.finditer(line)]
+                + [(m.start(), "label", m) for m in LABEL_RE.finditer(line)]
+                + [(m.start(), "ref", m) for m in REF_RE.finditer(line)],
+                key=lambda e: e[0],
+            )
+            for _, kind, match in events:
+                if kind == "env":
+                    if match.group(1) == "begin":
+                        envs.append(match.group(2))
+                    elif envs:
+                        envs.pop()
+                elif kind == "label":
+                    labels.append([match.group(1), number, envs[-1] if envs else ""])
+                else:
+                    # \cref{a,b} references several labels
+                    refs.extend([label.strip(), number] for label in match.group(1).split(","))
+    return {"labels": labels, "refs": refs}
+
+
+class LabelIndex:
+    """
+    Incrementally maintained label index of one course directory.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.index_file = root / INDEX_FILE
+        try:
+            self.files = json.loads(self.index_file.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.files = {}
+
+    def update(self) -> int:
+        """
+        Re-scan changed lectures, drop removed ones, save if needed.
+        Returns the number of re-scanned files.
+        """
+        current = {p.name: p for p in self.root.glob("lec_*.tex")}
+        changed = 0
+
+        for name in set(self.files) - set(current):
+            del self.files[name]
+            changed += 1
+
+        for name, path in current.items():
+            mtime = path.stat().st_mtime_ns
+            entry = self.files.get(name)
+            if entry and entry["mtime"] == mtime:
+                continue
+            self.files[name] = {"mtime": mtime, **scan_file(path)}
+            changed += 1
+
+        if changed:
+            tmp = self.index_file.with_name(f"{INDEX_FILE}.{os.getpid()}")
+            tmp.write_text(json.dumps(self.files, separators=(",", ":")))
+            os.replace(tmp, self.index_file)
+        return changed
+
+    # -------------------------
+    # Queries
+    # -------------------------
+
+    def labels(self, prefix: str = ""):
+        """
+        Yield (label, file, line, env) sorted by lecture and line.
+        """
+        for name in sorted(self.files, key=filename2number):
+            for label, line, env in self.files[name]["labels"]:
+                if label.startswith(prefix):
+                    yield label, name, line, env
+
+    def duplicates(self) -> dict:
+        """
+        {label: [(file, line), ...]} for labels defined more than once.
+        """
+        seen = {}
+        for label, name, line, _ in self.labels():
+            seen.setdefault(label, []).append((name, line))
+        return {label: places for label, places in seen.items() if len(places) > 1}
+
+    def undefined(self):
+        """
+        (label, file, line) for references without a matching label.
+        """
+        defined = {label for label, *_ in self.labels()}
+        return [
+            (label, name, line)
+            for name in sorted(self.files, key=filename2number)
+            for label, line in self.files[name]["refs"]
+            if label not in defined
+        ]
+
+
+# -----------------------------
+# Main
+# -----------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the course label index.")
+    parser.add_argument("command", choices=["list", "check"])
+    parser.add_argument("prefix", nargs="?", default="", help="label prefix for list")
+    parser.add_argument("--course", help="course short name (default: current course)")
+    args = parser.parse_args()
+
+    if args.course:
+        course = next((c for c in Courses() if c.info["short"] == args.course), None)
+        if course is None:
+            sys.exit(f"[error] Unknown course: {args.course}")
+    else:
+        course = current_course()
+
+    index = LabelIndex(course.path)
+    index.update()
+
+    if args.command == "list":
+        for label, name, line, env in index.labels(args.prefix):
+            print(f"{label}\t{name}:{line}\t{env}")
+        return
+
+    problems = 0
+    for label, places in index.duplicates().items():
+        problems += 1
+        where = ", ".join(f"{name}:{line}" for name, line in places)
+        print(f"[error] Duplicate label {label}: {where}")
+    for label, name, line in index.undefined():
+        problems += 1
+        print(f"[error] Undefined reference {label}: {name}:{line}")
+
+    if problems:
+        sys.exit(1)
+    print(f"[ok] No label problems in {course.info['title']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,13 +16,22 @@
 ===============================================================
 """
 
+import os
 import re
+import fcntl
+import signal
+import threading
 import subprocess
 import locale
-from datetime import datetime
+from bisect import bisect_left
+from datetime import datetime, timedelta
 from pathlib import Path
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
-from config import get_week, DATE_FORMAT, CURRENT_COURSE_ROOT
+import buildcache
+import frecency
+from config import get_week, parse_date, DATE_FORMAT, CURRENT_COURSE_ROOT, VIM_SERVER
 
 # Ensure locale for date formatting (adjust if needed)
 try:
@@ -33,7 +42,7 @@ except locale.Error:
 
 
 # -----------------------------
-# Filename helpers
+# Filename and range helpers
 # -----------------------------
 
 def number2filename(n: int) -> str:
@@ -46,6 +55,74 @@ def filename2number(s: str) -> int:
     return int(str(s).replace(".tex", "").replace("lec_", ""))
 
 
+def parse_day(s: str) -> datetime:
+    """Parse a YYYY-MM-DD day used in range expressions."""
+    return datetime.strptime(s, "%Y-%m-%d")
+
+
+def select(index, start, stop=None) -> list:
+    """
+    Numbers from a sorted (key, number) index with start <= key < stop.
+    """
+    lo = bisect_left(index, (start,))
+    hi = bisect_left(index, (stop,)) if stop is not None else len(index)
+    return [n for _, n in index[lo:hi]]
+
+
+# -----------------------------
+# Editor helpers
+# -----------------------------
+
+def vim_server_running() -> bool:
+    """True if a Vim clientserver named VIM_SERVER is up."""
+    try:
+        result = subprocess.run(
+            ["vim", "--serverlist"], capture_output=True, text=True, timeout=2
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return False
+    return VIM_SERVER.upper() in result.stdout.upper().split()
+
+
+# -----------------------------
+# Course locking
+# -----------------------------
+
+# Held for the duration of a latexmk run on out/
+BUILD_LOCK = ".build.lock"
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+@contextmanager
+def course_lock(root: Path, name: str = ".lock"):
+    """
+    Exclusive advisory lock (flock on root/name) shared by all processes.
+    The default lock guards master.tex rewrites and lecture creation and
+    is only ever held briefly; latexmk runs hold BUILD_LOCK instead, so
+    editing a course never waits on a compile.
+    Re-entrant, so callers can hold it across several steps.
+    """
+    key = (str(root.resolve()), name)
+    with _locks_guard:
+        state = _locks.setdefault(key, {"rlock": threading.RLock(), "depth": 0, "fd": None})
+
+    with state["rlock"]:
+        if state["depth"] == 0:
+            fd = os.open(root / name, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            state["fd"] = fd
+        state["depth"] += 1
+        try:
+            yield
+        finally:
+            state["depth"] -= 1
+            if state["depth"] == 0:
+                os.close(state["fd"])  # closing the fd releases the flock
+                state["fd"] = None
+
+
 # -----------------------------
 # Lecture object
 # -----------------------------
@@ -65,7 +142,7 @@ class Lecture:
             raise ValueError(f"No lecture metadata found in {file_path}")
 
         date_str = lecture_match.group(2)
-        date = datetime.strptime(date_str, DATE_FORMAT)
+        date = parse_date(date_str)
         week = get_week(date)
         title = lecture_match.group(3)
 
@@ -76,14 +153,27 @@ class Lecture:
         self.title = title
         self.course = course
 
-    def edit(self):
+    def edit(self, line: int = None):
         """
-        Open lecture file in Vim (server: kulak).
+        Open lecture file in Vim (server: VIM_SERVER), optionally at a line.
+        If the server is already running the file is sent to it directly;
+        a terminal is only spawned when there is no server yet.
         """
+        frecency.record(self.file_path.resolve())
+
+        jump = [f"+{line}"] if line else []
+        if vim_server_running():
+            subprocess.Popen(
+                ["vim", "--servername", VIM_SERVER, "--remote-silent", *jump, str(self.file_path)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            return
+
         subprocess.Popen([
             "x-terminal-emulator",
             "-e", "zsh", "-i", "-c",
-            f"\\vim --servername kulak --remote-silent {self.file_path}"
+            f"\\vim --servername {VIM_SERVER} --remote-silent {' '.join(jump)} {self.file_path}"
         ])
 
     def __str__(self):
@@ -99,6 +189,9 @@ class Lectures(list):
         self.course = course
         self.root = course.path
         self.master_file = self.root / "master.tex"
+        self.preamble_file = self.root.parent / "preamble.tex"
+        self.standalone_dir = self.root / ".standalone"
+        self.standalone_out = self.root / "out" / "lectures"
         super().__init__(self.read_files())
 
     def read_files(self):
@@ -126,16 +219,61 @@ class Lectures(list):
 
     def parse_range_string(self, arg: str):
         """
-        Parse a range string like 'all', '3-5', 'last', etc.
-        Returns list of lecture numbers.
+        Parse a lecture range expression into a sorted, deduplicated
+        list of existing lecture numbers. Items are comma-separated:
+          all, last, prev, 7         single keywords / numbers
+          3-5, prev-last             number ranges
+          last:3                     last three lectures
+          w3, w3-w5                  academic weeks
+          2026-03-02                 lectures on a day
+          2026-03-02..2026-03-20     day range (inclusive)
+          since:2026-03-02           from a day on
+        """
+        numbers = [(lecture.number, lecture.number) for lecture in self]
+        weeks = sorted((lecture.week, lecture.number) for lecture in self)
+        dates = sorted((lecture.date, lecture.number) for lecture in self)
+
+        items = [part.strip() for part in arg.split(",") if part.strip()]
+        if not items:
+            raise ValueError(f"Empty lecture range: {arg!r}")
+
+        result = set()
+        for item in items:
+            result.update(self.parse_range_item(item, numbers, weeks, dates))
+        return sorted(result)
+
+    def parse_range_item(self, item: str, numbers, weeks, dates):
         """
-        all_numbers = [lecture.number for lecture in self]
-        if "all" in arg:
-            return all_numbers
-        if "-" in arg:
-            start, end = [self.parse_lecture_spec(bit) for bit in arg.split("-")]
-            return list(set(all_numbers) & set(range(start, end + 1)))
-        return [self.parse_lecture_spec(arg)]
+        Resolve one range item against the sorted (key, number) indexes.
+        """
+        if item == "all":
+            return [n for _, n in numbers]
+
+        if item.startswith("last:"):
+            count = int(item[len("last:"):])
+            return [n for _, n in numbers[-count:]] if count > 0 else []
+
+        if item.startswith("since:"):
+            return select(dates, parse_day(item[len("since:"):]))
+
+        match = re.fullmatch(r"(\d{4}-\d{2}-\d{2})(?:\.\.(\d{4}-\d{2}-\d{2}))?", item)
+        if match:
+            start = parse_day(match.group(1))
+            end = parse_day(match.group(2) or match.group(1))
+            return select(dates, start, end + timedelta(days=1))
+
+        match = re.fullmatch(r"w(\d+)(?:-w?(\d+))?", item)
+        if match:
+            start = int(match.group(1))
+            end = int(match.group(2) or start)
+            return select(weeks, start, end + 1)
+
+        if "-" in item:
+            start, end = [self.parse_lecture_spec(bit) for bit in item.split("-")]
+            return select(numbers, start, end + 1)
+
+        number = self.parse_lecture_spec(item)
+        return select(numbers, number, number + 1)
 
     # -------------------------
     # Master.tex helpers
@@ -164,9 +302,12 @@ class Lectures(list):
         """
         Update master.tex to include given lecture numbers.
         """
-        header, footer = self.get_header_footer(self.master_file)
-        body = "".join("    " + r"\input{" + number2filename(n) + "}\n" for n in r)
-        self.master_file.write_text(header + body + footer)
+        with course_lock(self.root):
+            header, footer = self.get_header_footer(self.master_file)
+            body = "".join("    " + r"\input{" + number2filename(n) + "}\n" for n in r)
+            tmp = self.master_file.with_name(".master.tex.tmp")
+            tmp.write_text(header + body + footer)
+            os.replace(tmp, self.master_file)
 
     # -------------------------
     # Lecture creation
@@ -176,35 +317,165 @@ class Lectures(list):
         """
         Create a new lecture file, update master.tex, return Lecture object.
         """
-        new_number = self[-1].number + 1 if len(self) else 1
-        new_path = self.root / number2filename(new_number)
+        return self.new_lectures([datetime.today()], skip_taken=False)[0]
+
+    def new_lectures(self, dates, skip_taken: bool = True):
+        """
+        Create one lecture stub per date, numbered after the last lecture.
+        Unless skip_taken is False, dates on a day that already has a
+        lecture, or at/before the latest existing lecture, are skipped:
+        headers carry the actual creation time rather than the scheduled
+        slot, and numbering must stay chronological.
+        master.tex is rewritten once (previous lecture + new ones) and
+        the new Lecture objects are appended to this collection.
+        """
+        dates = {d.replace(second=0, microsecond=0) for d in dates}
+        if skip_taken and len(self):
+            taken_days = {lecture.date.date() for lecture in self}
+            latest = max(lecture.date for lecture in self)
+            dates = {d for d in dates if d.date() not in taken_days and d > latest}
+        dates = sorted(dates)
 
-        today = datetime.today()
-        date = today.strftime(DATE_FORMAT)
+        with course_lock(self.root):
+            # Number after the newest file on disk, in case another
+            # process created a lecture since this collection was read
+            on_disk = [filename2number(p.name) for p in self.root.glob("lec_*.tex")]
+            first = max(on_disk + [self[-1].number if len(self) else 0]) + 1
 
-        new_path.touch()
-        new_path.write_text(f"\\lecture{{{new_number}}}{{{date}}}{{}}\n")
+            created = []
+            for number, date in enumerate(dates, start=first):
+                path = self.root / number2filename(number)
+                path.write_text(f"\\lecture{{{number}}}{{{date.strftime(DATE_FORMAT)}}}{{}}\n")
+                created.append(Lecture(path, self.course))
 
-        if new_number == 1:
-            self.update_lectures_in_master([1])
-        else:
-            self.update_lectures_in_master([new_number - 1, new_number])
+            if not created:
+                return created
 
-        self.read_files()
-        return Lecture(new_path, self.course)
+            self.update_lectures_in_master(range(max(first - 1, 1), created[-1].number + 1))
+
+        self.extend(created)
+        return created
 
     # -------------------------
     # Compilation
     # -------------------------
 
-    def compile_master(self) -> int:
+    def compile_master(self, cancelled=None) -> int:
         """
         Run latexmk on master.tex. Return exit code.
+        Artifacts are restored from the build cache when all inputs
+        match a previous successful build.
+        If cancelled (a callable) returns True while latexmk runs,
+        latexmk is killed and None is returned.
+        """
+        with course_lock(self.root, BUILD_LOCK):
+            out_dir = self.root / "out"
+            key = buildcache.input_key(self.root)
+            if buildcache.restore(key, out_dir):
+                return 0
+
+            process = subprocess.Popen(
+                ["latexmk", "-f", "-interaction=nonstopmode", str(self.master_file)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=str(self.root),
+                start_new_session=cancelled is not None,
+            )
+            while True:
+                try:
+                    returncode = process.wait(timeout=0.2 if cancelled else None)
+                    break
+                except subprocess.TimeoutExpired:
+                    if cancelled():
+                        # latexmk runs in its own session: stop xelatex/bibtex too
+                        os.killpg(process.pid, signal.SIGTERM)
+                        process.wait()
+                        return None
+
+            # master.tex may have been rewritten during the run; only cache
+            # the artifacts if they still belong to the hashed inputs
+            if returncode == 0 and out_dir.is_dir() and buildcache.input_key(self.root) == key:
+                buildcache.store(key, out_dir)
+            return returncode
+
+    # -------------------------
+    # Standalone lecture PDFs
+    # -------------------------
+
+    def write_standalone(self, lecture, header: str, footer: str) -> Path:
+        """
+        Write a thin wrapper document for one lecture between the
+        master.tex header and footer. The file is only rewritten when
+        its content changes, so its mtime can be used for rebuild checks.
+        """
+        content = header + "    " + r"\input{" + lecture.file_path.name + "}\n" + footer
+
+        wrapper = self.standalone_dir / lecture.file_path.name
+        if not wrapper.exists() or wrapper.read_text() != content:
+            self.standalone_dir.mkdir(exist_ok=True)
+            wrapper.write_text(content)
+        return wrapper
+
+    def standalone_pdf(self, lecture) -> Path:
+        return self.standalone_out / lecture.file_path.with_suffix(".pdf").name
+
+    def standalone_outdated(self, lecture, wrapper: Path) -> bool:
+        """
+        True if the lecture PDF is missing or older than the lecture,
+        its wrapper or the course preamble.
+        """
+        pdf = self.standalone_pdf(lecture)
+        if not pdf.exists():
+            return True
+        sources = [lecture.file_path, wrapper, self.preamble_file]
+        newest = max(p.stat().st_mtime for p in sources if p.exists())
+        return pdf.stat().st_mtime < newest
+
+    def compile_lecture(self, lecture, wrapper: Path) -> int:
+        """
+        Run latexmk on one lecture wrapper. Return exit code.
+        A failed build leaves no PDF, so it is retried on the next run.
         """
         result = subprocess.run(
-            ["latexmk", "-f", "-interaction=nonstopmode", str(self.master_file)],
+            [
+                "latexmk", "-f", "-interaction=nonstopmode",
+                f"-outdir={self.standalone_out}",
+                f"-jobname={lecture.file_path.stem}",
+                str(wrapper),
+            ],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             cwd=str(self.root),
         )
+        if result.returncode != 0:
+            # latexmk -f leaves a fresh PDF behind even on errors; drop it
+            # so standalone_outdated retries this lecture next time
+            self.standalone_pdf(lecture).unlink(missing_ok=True)
         return result.returncode
+
+    def compile_standalone(self, numbers=None, workers: int = None) -> dict:
+        """
+        Build one PDF per lecture (out/lectures/lec_XX.pdf), only for
+        lectures whose source, wrapper or preamble changed, across a
+        worker pool. Returns {lecture number: exit code} for the
+        lectures that were compiled.
+        Uses its own lock (.standalone/.lock) so it never blocks
+        master compiles, which write to a different output directory.
+        """
+        numbers = set(numbers) if numbers is not None else None
+        with course_lock(self.root):
+            header, footer = self.get_header_footer(self.master_file)
+
+        self.standalone_dir.mkdir(exist_ok=True)
+        with course_lock(self.standalone_dir):
+            todo = []
+            for lecture in self:
+                if numbers is not None and lecture.number not in numbers:
+                    continue
+                wrapper = self.write_standalone(lecture, header, footer)
+                if self.standalone_outdated(lecture, wrapper):
+                    todo.append((lecture, wrapper))
+
+            with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+                codes = pool.map(lambda job: self.compile_lecture(*job), todo)
+                return {lecture.number: code for (lecture, _), code in zip(todo, codes)}
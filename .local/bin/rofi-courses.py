@@ -8,7 +8,8 @@
  Description:
    Rofi interface to select and activate a course.
    Highlights the current course, and updates the symlink +
-   watch file if a new course is chosen.
+   watch file if a new course is chosen. Only the most frecent
+   courses are listed, with an "All courses" fallback.
 
  Inspiration:
    Adapted and extended from Gilles Castel's lecture note workflow.
@@ -16,30 +17,46 @@
 """
 
 from rofi import rofi
-from courses import Courses
+import frecency
+from courses import Courses, course_paths
+from config import MENU_TOP_K
 
+ALL_COURSES = "All courses ..."
 
-def select_course(courses: Courses):
+
+def select_course(courses: Courses, more: bool = False):
     """
     Show course list in rofi, return selected index or -1 if cancelled.
+    With more=True an extra "All courses" entry is appended; selecting
+    it returns len(courses).
     """
     try:
         current_index = courses.index(courses.current)
-        args = ["-a", current_index]  # Highlight current course
+        args = ["-a", str(current_index)]  # Highlight current course
     except ValueError:
         args = []
 
+    options = [c.info["title"] for c in courses] + ([ALL_COURSES] if more else [])
     code, index, _ = rofi(
         "Select course",
-        [c.info["title"] for c in courses],
-        ["-auto-select", "-no-custom", "-lines", str(len(courses))] + args,
+        options,
+        ["-auto-select", "-no-custom", "-lines", str(len(options))] + args,
     )
     return index
 
 
 def main():
-    courses = Courses()
-    index = select_course(courses)
+    """
+    Show the MENU_TOP_K most frecent courses, or all of them on request.
+    """
+    paths = frecency.rank([p.resolve() for p in course_paths()])
+    courses = Courses(paths[:MENU_TOP_K])
+    more = len(paths) > MENU_TOP_K
+    index = select_course(courses, more)
+
+    if more and index == len(courses):
+        courses = Courses()
+        index = select_course(courses)
 
     if index >= 0:
         courses.current = courses[index]
@@ -8,20 +8,26 @@
  Description:
    Rofi interface to update which lectures are included in
    master.tex for the current course. Lets user quickly select
-   between preset lecture ranges and recompiles the notes.
+   between preset lecture ranges and queues a background
+   recompile (see compilequeue.py), returning immediately.
+   Any range expression can also be typed, e.g. "1,4,7-9",
+   "w3-w5", "last:3" or "since:2026-03-02".
 
  Inspiration:
    Adapted and extended from Gilles Castel's lecture note workflow.
 ===============================================================
 """
 
+import frecency
 from courses import Courses
+from compilequeue import request_compile
 from rofi import rofi
 
 
 def select_view():
     """
-    Show lecture range options in rofi, return command string.
+    Show lecture range options in rofi, return command string,
+    or None if the menu was cancelled or nothing was entered.
     """
     commands = ["last", "prev-last", "all", "prev"]
     options = [
@@ -31,24 +37,30 @@ def select_view():
         "Previous lectures",
     ]
 
-    _, index, selected = rofi(
+    code, index, selected = rofi(
         "Select view",
         options,
-        ["-lines", "4", "-auto-select"],
+        ["-lines", "4", "-auto-select", "-mesg", "or type a range: 1,4,7-9 | w3-w5 | last:3 | since:YYYY-MM-DD"],
     )
 
+    if code != 0:
+        return None
     if index >= 0:
         return commands[index]
-    return selected
+    return selected or None
 
 
 def main():
-    lectures = Courses().current.lectures
     command = select_view()
+    if command is None:
+        return
+
+    lectures = Courses().current.lectures
     lecture_range = lectures.parse_range_string(command)
     lectures.update_lectures_in_master(lecture_range)
-    lectures.compile_master()
-    print(f"[ok] Updated master.tex with {command} lectures")
+    frecency.record(lectures.root.resolve())
+    request_compile(lectures.root)
+    print(f"[ok] Updated master.tex with {command} lectures, compiling in background")
 
 
 if __name__ == "__main__":
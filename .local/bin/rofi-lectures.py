@@ -8,24 +8,32 @@
  Description:
    Rofi interface to manage lectures in the current course.
    - Select a lecture to edit in Vim
-   - Press Ctrl+n to create a new lecture and open it
+   - Press Ctrl+n to create a new lecture, open it and queue
+     a background recompile of master.tex
+   Only the most frecent lectures are parsed and listed, with an
+   "All lectures" fallback.
 
  Inspiration:
    Adapted and extended from Gilles Castel's lecture note workflow.
 ===============================================================
 """
 
-from courses import Courses
+import frecency
+from courses import current_course
+from lectures import Lecture, filename2number
 from rofi import rofi
+from compilequeue import request_compile
 from utils import generate_short_title, MAX_LEN
+from config import MENU_TOP_K
+
+ALL_LECTURES = "All lectures ..."
 
 
 def build_options(lectures):
     """
     Format lecture list for rofi display.
     """
-    sorted_lectures = sorted(lectures, key=lambda l: -l.number)
-    options = [
+    return [
         "{number: >2}. <b>{title: <{fill}}</b> <span size='smaller'>{date} ({week})</span>".format(
             fill=MAX_LEN,
             number=lec.number,
@@ -33,33 +41,52 @@ def build_options(lectures):
             date=lec.date.strftime("%a %d %b"),
             week=lec.week,
         )
-        for lec in sorted_lectures
+        for lec in lectures
     ]
-    return sorted_lectures, options
 
 
-def select_lecture(lectures):
+def select_lecture(lectures, more: bool = False):
     """
     Open rofi, return key and selected lecture index.
+    With more=True an extra "All lectures" entry is appended;
+    selecting it returns len(lectures).
     """
-    sorted_lectures, options = build_options(lectures)
+    options = build_options(lectures) + ([ALL_LECTURES] if more else [])
     key, index, _ = rofi(
         "Select lecture",
         options,
-        ["-lines", "5", "-markup-rows", "-kb-row-down", "Down", "-kb-custom-1", "Ctrl+n"],
+        ["-lines", str(min(len(options), MENU_TOP_K + 1)), "-markup-rows",
+         "-kb-row-down", "Down", "-kb-custom-1", "Ctrl+n"],
     )
-    return key, index, sorted_lectures
+    return key, index
+
+
+def top_lectures(course):
+    """
+    Parse only the MENU_TOP_K most frecent lecture files
+    (newest first when unused). Returns (lectures, more).
+    """
+    files = sorted(course.path.glob("lec_*.tex"), key=lambda p: -filename2number(p.stem))
+    ranked = frecency.rank(files)
+    return [Lecture(f, course) for f in ranked[:MENU_TOP_K]], len(files) > MENU_TOP_K
 
 
 def main():
-    lectures = Courses().current.lectures
-    key, index, sorted_lectures = select_lecture(lectures)
+    course = current_course()
+    shown, more = top_lectures(course)
+    key, index = select_lecture(shown, more)
+
+    if key == 0 and more and index == len(shown):
+        shown = sorted(course.lectures, key=lambda l: -l.number)
+        key, index = select_lecture(shown)
 
     if key == 0 and index >= 0:
-        sorted_lectures[index].edit()
+        shown[index].edit()
     elif key == 1:  # Ctrl+n
-        new_lecture = lectures.new_lecture()
+        new_lecture = course.lectures.new_lecture()
         new_lecture.edit()
+        frecency.record(course.path.resolve())
+        request_compile(course.path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+===============================================================
+ Script: semester-stats.py
+ Author: Kris Yotam (aka. khr1st)
+ Date:   2026-10-19
+ License: MIT License
+ Description:
+   Weekly timeline and workload summary across all courses.
+   Loads every lecture date into NumPy arrays once and computes
+   per-week/per-course counts, the longest gap between lectures
+   and the "behind" backlog (past lectures whose title is still
+   empty, e.g. stubs from bulk-lectures.py) in one vectorized pass.
+
+   Usage:
+     semester-stats.py          # per-course table + weekly timeline
+     semester-stats.py --bar    # one line for the status bar
+
+ Inspiration:
+   Adapted and extended from Gilles Castel's lecture note workflow.
+===============================================================
+"""
+
+import argparse
+from datetime import datetime
+
+import numpy as np
+
+from courses import Courses
+from config import get_week
+
+
+# -----------------------------
+# Loading
+# -----------------------------
+
+def load_columns(courses):
+    """
+    Flatten all lectures of all courses into columnar arrays:
+    dates (datetime64[m]), course index and an 'empty title' mask.
+    """
+    dates, course_idx, empty = [], [], []
+    for i, course in enumerate(courses):
+        for lecture in course.lectures:
+            dates.append(lecture.date)
+            course_idx.append(i)
+            empty.append(not lecture.title.strip())
+    return (
+        np.array(dates, dtype="datetime64[m]"),
+        np.array(course_idx, dtype=np.intp),
+        np.array(empty, dtype=bool),
+    )
+
+
+# -----------------------------
+# Vectorized helpers
+# -----------------------------
+
+def get_weeks(dates: np.ndarray) -> np.ndarray:
+    """
+    Vectorized config.get_week: academic week from strftime('%W').
+    """
+    days = dates.astype("datetime64[D]")
+    yday = (days - days.astype("datetime64[Y]").astype("datetime64[D]")).astype(int)
+    weekday = (days.astype(int) + 3) % 7  # Monday = 0 (1970-01-01 was a Thursday)
+    iso_w = (yday + 7 - weekday) // 7
+    return (iso_w + 52 - 5) % 52
+
+
+def compute_stats(dates, course_idx, empty, n_courses, now):
+    """
+    Return per-course totals, done/behind counts, max gap (days),
+    and a (n_courses, 52) matrix of lectures per academic week.
+    """
+    weeks = get_weeks(dates)
+    past = dates <= np.datetime64(now, "m")
+
+    per_week = np.bincount(course_idx * 52 + weeks, minlength=n_courses * 52)
+    per_week = per_week.reshape(n_courses, 52)
+
+    total = np.bincount(course_idx, minlength=n_courses)
+    behind = np.bincount(course_idx, weights=past & empty, minlength=n_courses).astype(int)
+    given = np.bincount(course_idx, weights=past, minlength=n_courses).astype(int)
+
+    # Longest gap between consecutive lectures of the same course
+    order = np.lexsort((dates, course_idx))
+    sorted_dates, sorted_idx = dates[order], course_idx[order]
+    gaps = np.diff(sorted_dates).astype("timedelta64[D]").astype(int)
+    same = sorted_idx[1:] == sorted_idx[:-1]
+    max_gap = np.zeros(n_courses, dtype=int)
+    np.maximum.at(max_gap, sorted_idx[1:][same], gaps[same])
+
+    return {
+        "total": total,
+        "given": given,
+        "behind": behind,
+        "max_gap": max_gap,
+        "per_week": per_week,
+    }
+
+
+# -----------------------------
+# Output
+# -----------------------------
+
+def print_table(courses, stats, current_week):
+    active = np.flatnonzero(stats["per_week"].any(axis=0))
+    weeks = range(active.min(), active.max() + 1) if active.size else range(0)
+
+    print(f"{'course':<12}{'total':>6}{'given':>6}{'behind':>7}{'gap':>5}  "
+          + "".join(f"{w:>3}" for w in weeks))
+    for i, course in enumerate(courses):
+        row = "".join(
+            f"{stats['per_week'][i, w] or '.':>3}" for w in weeks
+        )
+        print(f"{course.info['short']:<12}{stats['total'][i]:>6}{stats['given'][i]:>6}"
+              f"{stats['behind'][i]:>7}{stats['max_gap'][i]:>5}  {row}")
+    print(f"\nweek {current_week}, {stats['behind'].sum()} lectures behind")
+
+
+def bar_line(courses, stats, current_week):
+    behind = [
+        f"{course.info['short']} {n}"
+        for course, n in zip(courses, stats["behind"]) if n
+    ]
+    return " ".join([f"W{current_week}", f"{stats['given'].sum()}/{stats['total'].sum()}"]
+                    + (["behind: " + ", ".join(behind)] if behind else []))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Semester lecture statistics.")
+    parser.add_argument("--bar", action="store_true", help="print a single status bar line")
+    args = parser.parse_args()
+
+    now = datetime.now()
+    courses = Courses()
+    stats = compute_stats(*load_columns(courses), len(courses), now)
+
+    if args.bar:
+        print(bar_line(courses, stats, get_week(now)))
+    else:
+        print_table(courses, stats, get_week(now))
+
+
+if __name__ == "__main__":
+    main()